@@ -25,22 +25,91 @@ and the ability to specify resource IDs by resource name.
 from __future__ import annotations
 
 import configparser
-from copy import deepcopy
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import re
+from collections import ChainMap
+from datetime import datetime, timedelta, timezone
 from os import PathLike
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from requests import Response
+if TYPE_CHECKING:
+    from requests import Response
 
 if __name__ == '__main__':
     from fictoken import FicToken
     from mycipher import MyCipher, PasswordNotSet
-    from playbook import Playbook, PlaybookParameter
+    from playbook import Playbook, PlaybookParameter, _new_session
 else:
     from .fictoken import FicToken
     from .mycipher import MyCipher, PasswordNotSet, input_password
-    from .playbook import Playbook, PlaybookParameter
+    from .playbook import Playbook, PlaybookParameter, _new_session
+
+# .iniファイルの必須オプション（セクション毎）
+_REQUIRED_OPTIONS: dict[str, set[str]] = {
+    'auth': {'api_endpoint', 'api_key', 'api_secret'},
+    'tenant': {'tenant_id'},
+}
+
+# get_resources()で取得するリソース（リソース種別, リソースIDのキー）
+_RESOURCE_IDS: tuple[tuple[str, str], ...] = (
+    ('ports', 'portId'),
+    ('connections', 'connectionId'),
+    ('routers', 'routerId'),
+)
+# ルータに付随するリソースIDのキー
+_ROUTER_SUB_IDS: tuple[str, ...] = ('fwId', 'natId')
+# 相対時刻（-nndays, -nnhours, -nnminutes）
+_RELATIVE_TIME = re.compile(r'([+-]?\d+)\s*(days|hours|minutes)')
+
+
+class _Tenant(dict):
+    """キーの大文字・小文字を区別しない辞書
+    ConfigParserのセクションと同様に、キーは小文字にして保持する
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key: str) -> str:
+        return super().__getitem__(key.lower())
+
+    def __setitem__(self, key: str, value: str) -> None:
+        super().__setitem__(key.lower(), value)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key.lower())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and super().__contains__(key.lower())
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        return super().get(key.lower(), default)
+
+    def update(self, *args, **kwargs) -> None:
+        items = dict(*args, **kwargs).items()
+        super().update((key.lower(), value) for key, value in items)
+
+    def pop(self, key: str, *args) -> str:
+        return super().pop(key.lower(), *args)
+
+    def setdefault(self, key: str, default: str | None = None) -> str | None:
+        return super().setdefault(key.lower(), default)
+
+    def copy(self) -> _Tenant:
+        return type(self)(self)
+
+    @classmethod
+    def fromkeys(cls, keys, value: str | None = None) -> _Tenant:
+        return cls((key, value) for key in keys)
+
+    def __or__(self, other) -> _Tenant:
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ior__(self, other) -> _Tenant:
+        self.update(other)
+        return self
 
 
 class FicAPI:
@@ -67,29 +136,52 @@ class FicAPI:
             if password is None:
                 raise PasswordNotSet('password unmatched.')
         self._cipher = MyCipher(password)
-        self._token = FicToken(password=password)
+        self._token = FicToken(cipher=self._cipher)
 
         # コンフィグファイル読込
         self.config = configparser.ConfigParser()
-        with Path(file).open(encoding='utf-8') as f:
-            self.config.read_file(f)
-        for section, option in (('auth', 'api_endpoint'),
-                                ('auth', 'api_key'),
-                                ('auth', 'api_secret'),
-                                ('tenant', 'tenant_id')):
-            if not self.config.has_option(section, option):
+        if not self.config.read(file, encoding='utf-8'):
+            raise FileNotFoundError(f'"{file}" is not found.')
+        for section, options in _REQUIRED_OPTIONS.items():
+            if self.config.has_section(section):
+                options = options - set(self.config[section])
+            if options:
+                missing = ', '.join(sorted(options))
                 raise ValueError(
-                    f'required option "{option}" not found in .ini')
-        self.tenant = self.config['tenant']
+                    f'required option "{missing}" not found in .ini')
+        # ConfigParserのセクションはアクセスの度に値を展開するので辞書に変換する
+        self.tenant = _Tenant(self.config['tenant'])
         self.tenant['token_id'] = self._token.id
         self.token_file = Path(f'./.{self.tenant["tenant_id"]}.token')
+        self._token_mtime: int | None = None
+
+        # HTTPセッション（接続を再利用する）
+        self._session = _new_session()
+
+    def __enter__(self) -> FicAPI:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """HTTPセッションを閉じる"""
+        self._session.close()
 
     def get_token(self) -> None:
         """トークンを取得する
         取得済みトークンの有効期限が切れている場合は再取得する
+        トークンファイルは前回の読み書きから更新されている場合のみ読み込み、
+        トークンを再取得した場合のみ書き込む
         """
-        if not self._token and self.token_file.is_file():
-            self._token.read(self.token_file)
+        if not self._token:
+            try:
+                mtime = self.token_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            if mtime is not None and mtime != self._token_mtime:
+                self._token.read(self.token_file)
+                self._token_mtime = mtime
         if not self._token:
             # プレイブックを実行してトークンを取得する
             playbook = PlaybookParameter(
@@ -126,23 +218,18 @@ class FicAPI:
                     }
                 }
             )
-            response = Playbook(playbook).exec(self.tenant)
+            response = Playbook(playbook).exec(self.tenant,
+                                               session=self._session)
             response.raise_for_status()
             self._token.update(response)
+            # トークンをファイルに出力する
+            self._token.write(self.token_file)
+            self._token_mtime = self.token_file.stat().st_mtime_ns
         self.tenant['token_id'] = self._token.id
-        # トークンをファイルに出力する
-        self._token.write(self.token_file)
 
     def get_resources(self):
         """resouceNameをキー、resourceIdを値とするオプションをself.tenantに追加する
         """
-        @dataclass
-        class Resource:
-            type: str
-            name: str
-            id: str
-            id2: str = ''
-
         # プレイブック実行
         self.request(
             {
@@ -161,34 +248,25 @@ class FicAPI:
         # self.tenantにテナント名を追加
         self.tenant['tenantName'] = response_body['tenantName']
 
-        # self.tenantにリソース名とリソースIDの情報を追加
-        resources: tuple[Resource, ...] = (
-            Resource('ports', 'name', 'portId', ""),
-            Resource('connections', 'name', 'connectionId', ""),
-            Resource('routers', 'name', 'routerId', ""),
-        )
-        for res in resources:
-            for resource in response_body[res.type]:
-                res_name = resource[res.name]
-                res_id = resource[res.id]
-                self.tenant[res_name] = res_id
-                self.tenant[res_id] = res_name
-
-        # self.tenantにfwIdとnatIdの情報を追加
-        resources = (
-            Resource('routers', 'name', 'fwId', 'natId'),
-        )
-        for res in resources:
-            for resource in response_body[res.type]:
-                res_name = resource[res.name]
-                res_fwid = resource[res.id]
-                res_natid = resource[res.id2]
-                if res_fwid:
-                    self.tenant[f'{res_name}_{res.id}'] = res_fwid
-                    self.tenant[res_fwid] = f'{res_name}_{res.id}'
-                if res_natid:
-                    self.tenant[f'{res_name}_{res.id2}'] = res_natid
-                    self.tenant[res_natid] = f'{res_name}_{res.id2}'
+        # リソース名とリソースIDの情報をまとめてself.tenantに追加
+        resources: dict[str, str] = {}
+        for res_type, id_key in _RESOURCE_IDS:
+            for resource in response_body[res_type]:
+                res_name = resource['name']
+                res_id = resource[id_key]
+                resources[res_name] = res_id
+                resources[res_id] = res_name
+
+        # fwIdとnatIdの情報（名前は"ルータ名_fwId"、"ルータ名_natId"）
+        for resource in response_body['routers']:
+            for id_key in _ROUTER_SUB_IDS:
+                res_id = resource[id_key]
+                if res_id:
+                    res_name = f'{resource["name"]}_{id_key}'
+                    resources[res_name] = res_id
+                    resources[res_id] = res_name
+
+        self.tenant.update(resources)
 
     def request(
         self,
@@ -206,18 +284,24 @@ class FicAPI:
         self.get_token()
 
         # self.tenantの"from", "to"を時刻に書き換える
-        tenant = deepcopy(self.tenant)
+        # （self.tenantは変更せず、書き換えた値だけを上に重ねる）
+        tenant = ChainMap(_Tenant(), self.tenant)
         _from: str = tenant.get('from', '-7days').strip()
         _to: str = tenant.get('to', 'now').strip()
+        to: datetime | None = None
         if _to == 'now':
-            tenant['to'] = str(datetime.now().astimezone())
-        if _from.endswith('days'):
-            dt = timedelta(days=int(_from[:-4]))
-            tenant['from'] = str(datetime.fromisoformat(tenant['to']) + dt)
+            to = datetime.now(timezone.utc)
+            tenant['to'] = str(to)
+        m = _RELATIVE_TIME.fullmatch(_from)
+        if m:
+            if to is None:
+                to = datetime.fromisoformat(_to)
+            dt = timedelta(**{m.group(2): int(m.group(1))})
+            tenant['from'] = str(to + dt)
 
         # 実行
         if isinstance(playbook, Playbook):
-            self.r = playbook.exec(tenant)
+            self.r = playbook.exec(tenant, session=self._session)
         else:
-            self.r = Playbook(playbook).exec(tenant)
+            self.r = Playbook(playbook).exec(tenant, session=self._session)
         return self.r
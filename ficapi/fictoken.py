@@ -22,15 +22,31 @@ retrieved from the Response object after accessing keystone.
 from __future__ import annotations
 
 import json
-from copy import copy, deepcopy
-from datetime import datetime
+from copy import copy
+from datetime import datetime, timezone
 from os import PathLike
 from pathlib import Path
-
-import requests
+from typing import TYPE_CHECKING, Any
 
 from . import mycipher
 
+if TYPE_CHECKING:
+    import requests
+
+# orjsonがあれば使用する
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=4).encode('utf-8')
+
 TOKENID = 'X-Subject-Token'
 EXPIRES = 'expires_at'
 
@@ -40,7 +56,8 @@ class FicToken:
     def __init__(self,
                  token: PathLike | str | dict | None = None,
                  *,
-                 password: str | None = None
+                 password: str | None = None,
+                 cipher: mycipher.MyCipher | None = None
                  ):
         """トークンの作成
 
@@ -49,6 +66,8 @@ class FicToken:
                 - PathLike | str: ファイル名
                 - dict: トークンデータ
             password (str | None): パスワード
+            cipher (MyCipher | None): 暗号化オブジェクト
+                指定した場合はpasswordより優先する
 
         Raises:
             TypeError: 引数の型が不正
@@ -56,7 +75,13 @@ class FicToken:
         if not isinstance(password, (str, type(None))):
             raise TypeError(f'invalid arg type {type(password)}, '
                             f'must be {str} or None.')
-        self._cipher = mycipher.MyCipher(password)
+        if isinstance(cipher, mycipher.MyCipher):
+            self._cipher = cipher
+        elif cipher is None:
+            self._cipher = mycipher.MyCipher(password)
+        else:
+            raise TypeError(f'invalid arg type {type(cipher)}, '
+                            f'must be {mycipher.MyCipher} or None.')
 
         self._token = {
             TOKENID: 'xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx',
@@ -73,6 +98,7 @@ class FicToken:
                             f'must be {PathLike}, {str} or {dict}.')
 
         self._check_token()
+        self._cache_expire_time()
 
     def __str__(self) -> str:
         """トークンIDを返す"""
@@ -97,9 +123,17 @@ class FicToken:
         Raises:
             KeyError: 必須要素がない
         """
-        if not {TOKENID, EXPIRES} <= set(self._token):
+        if TOKENID not in self._token or EXPIRES not in self._token:
             raise KeyError(f'"{TOKENID}" or "{EXPIRES}" is not found in token')
 
+    def _cache_expire_time(self) -> None:
+        """トークンの有効期限を解析して保持する
+        トークンを置き換えた場合には必ず呼び出すこと
+        """
+        self._expire_time = datetime.fromisoformat(
+            self._token[EXPIRES].replace('Z', '+00:00')
+        )
+
     @property
     def id(self) -> str:
         """トークンIDを返す
@@ -116,9 +150,7 @@ class FicToken:
         Returns:
             datetime: 有効期限（タイムゾーン有り）
         """
-        return datetime.fromisoformat(
-            self._token[EXPIRES].replace('Z', '+00:00')
-        )
+        return self._expire_time
 
     @property
     def is_valid(self) -> bool:
@@ -127,7 +159,7 @@ class FicToken:
         Returns:
             bool: 有効期限内ならTrue、有効期限切れならFalse
         """
-        return self.expire_time > datetime.now().astimezone()
+        return self._expire_time > datetime.now(timezone.utc)
 
     def read(self, file: PathLike | str, password: str | None = None) -> None:
         """ファイル（JSON形式）からトークンを読み込む
@@ -151,9 +183,10 @@ class FicToken:
         else:
             raise TypeError(f'password must be {str}.')
 
-        self._token = json.loads(Path(file).read_text(encoding='utf-8'))
+        self._token = _loads(Path(file).read_bytes())
         self._check_token()
         self._token[TOKENID] = cipher.decrypt(self._token[TOKENID])
+        self._cache_expire_time()
         self._cipher = cipher
 
     def write(self, file: PathLike | str, password: str | None = None) -> None:
@@ -177,9 +210,9 @@ class FicToken:
         else:
             raise TypeError(f'password must be {str}.')
 
-        token = deepcopy(self._token)
+        token = dict(self._token)
         token[TOKENID] = cipher.encrypt(token[TOKENID])
-        Path(file).write_text(json.dumps(token, indent=4), encoding='utf-8')
+        Path(file).write_bytes(_dumps(token))
         self._cipher = cipher
 
     def update(self, response: requests.Response) -> None:
@@ -195,11 +228,12 @@ class FicToken:
             TypeError: 引数の型が不正
             ValueError: レスポンスオブジェクトに必須情報がない
         """
+        import requests
         if not isinstance(response, requests.Response):
             raise TypeError(f'invalid arg type {type(response)}, '
                             f'must be {requests.Response}.')
 
-        body = response.json()
+        body = _loads(response.content)
         if TOKENID not in response.headers:
             raise ValueError(f'"{TOKENID}" is not found in response header.')
         if EXPIRES not in body['token']:
@@ -208,3 +242,4 @@ class FicToken:
         # トークンの置き換え
         self._token = dict(response.headers)
         self._token[EXPIRES] = body['token'][EXPIRES]
+        self._cache_expire_time()
@@ -19,12 +19,25 @@ using hash values generated from password strings.
 """
 from __future__ import annotations
 
+import base64
 import binascii
 import getpass
 import hashlib
+import os
+import re
 from typing import Any
 
-from Crypto.Cipher import AES
+
+# 旧形式の暗号文字列（16進文字列）
+_HEX_TEXT = re.compile(r'(?:[0-9a-f]{2})+')
+
+# 鍵導出（PBKDF2）のパラメータ
+_KDF_SALT = b'ficapi-v1-salt'
+_KDF_ITERATIONS = 100_000
+
+# AES-GCMのナンスとタグの長さ（暗号文字列は ナンス + 暗号文 + タグ）
+_GCM_NONCE_SIZE = 12
+_GCM_TAG_SIZE = 16
 
 
 class DecryptionError(Exception):
@@ -35,6 +48,16 @@ class PasswordNotSet(Exception):
     """パスワード未設定エラー"""
 
 
+def _sha256_bytes(data: bytes) -> bytes:
+    """バイト列のハッシュ値を返す（sha256）"""
+    return hashlib.sha256(data).digest()
+
+
+def _md5_bytes(data: bytes) -> bytes:
+    """バイト列のハッシュ値を返す（md5）"""
+    return hashlib.md5(data).digest()
+
+
 def input_password() -> str | None:
     """パスワードをコンソールから入力する
     成功の場合、パスワード文字列からハッシュ値を計算し保持する
@@ -66,6 +89,9 @@ class MyCipher:
             TypeError: 引数の型が不正
         """
         self.secret: bytes | None
+        self._key: bytes | None = None
+        self._legacy_key: bytes | None = None
+        self._legacy_nonce: bytes | None = None
         if password is None:
             self.secret = None
         elif isinstance(password, str):
@@ -76,6 +102,8 @@ class MyCipher:
 
     def setsecret(self, password: str) -> None:
         """パスワード文字列からハッシュ値を計算し保持する
+        暗号化に使用する鍵もここで計算しておく（PBKDF2）
+        旧形式の暗号文字列を復号化するための鍵とナンスも計算する
 
         Args:
             password (str): パスワード文字列
@@ -87,24 +115,49 @@ class MyCipher:
             raise TypeError(f'invalid arg type {type(password)}, '
                             f'must be {str}.')
 
-        self.secret = self.sha256(password)
+        self._key = hashlib.pbkdf2_hmac('sha256',
+                                        password.encode('utf-8'),
+                                        _KDF_SALT,
+                                        _KDF_ITERATIONS)
 
-    @property
-    def _cipher(self) -> Any:
+        self.secret = _sha256_bytes(password.encode('utf-8'))
+        self._legacy_key = _sha256_bytes(self.secret)
+        self._legacy_nonce = _md5_bytes(self.secret)
+
+    def _gcm_cipher(self, nonce: bytes) -> Any:
         """暗号化オブジェクト（cipher）を返す
 
+        Args:
+            nonce (bytes): ナンス（暗号化毎に生成する）
+
+        Raises:
+            PasswordNotSet: self.secretがNone
+
+        Returns:
+            Any: AES.new()によりGcmMODEが返される
+        """
+        if self._key is None:
+            raise PasswordNotSet('password is not set.')
+
+        from Crypto.Cipher import AES
+        return AES.new(self._key, AES.MODE_GCM, nonce=nonce)
+
+    @property
+    def _legacy_cipher(self) -> Any:
+        """旧形式の暗号化オブジェクト（cipher）を返す
+        鍵とナンスはパスワードのハッシュ値から計算したもの
+
         Raises:
             PasswordNotSet: self.secretがNone
 
         Returns:
             Any: AES.new()によりEaxMODEが返される
         """
-        if self.secret is None:
+        if self._legacy_key is None:
             raise PasswordNotSet('password is not set.')
 
-        return AES.new(self.sha256(self.secret),
-                       AES.MODE_EAX,
-                       self.md5(self.secret))
+        from Crypto.Cipher import AES
+        return AES.new(self._legacy_key, AES.MODE_EAX, self._legacy_nonce)
 
     def sha256(self, text: str | bytes) -> bytes:
         """文字列のハッシュ値を返す（sha256）
@@ -118,13 +171,13 @@ class MyCipher:
         Raises:
             TypeError: 引数の型が不正
         """
-        if isinstance(text, str):
-            return hashlib.sha256(text.encode('utf-8')).digest()
-        elif isinstance(text, bytes):
-            return hashlib.sha256(text).digest()
-        else:
-            raise TypeError(f'invalid arg type {type(text)}, '
-                            f'must be {str} or {bytes}.')
+        try:
+            return _sha256_bytes(text)
+        except TypeError:
+            if not isinstance(text, str):
+                raise TypeError(f'invalid arg type {type(text)}, '
+                                f'must be {str} or {bytes}.') from None
+            return _sha256_bytes(text.encode('utf-8'))
 
     def md5(self, text: str | bytes) -> bytes:
         """文字列のハッシュ値を返す（md5）
@@ -138,16 +191,17 @@ class MyCipher:
         Raises:
             TypeError: textの型が不正
         """
-        if isinstance(text, str):
-            return hashlib.md5(text.encode('utf-8')).digest()
-        elif isinstance(text, bytes):
-            return hashlib.md5(text).digest()
-        else:
-            raise TypeError(f'invalid arg type {type(text)}, '
-                            f'must be {str} or {bytes}.')
+        try:
+            return _md5_bytes(text)
+        except TypeError:
+            if not isinstance(text, str):
+                raise TypeError(f'invalid arg type {type(text)}, '
+                                f'must be {str} or {bytes}.') from None
+            return _md5_bytes(text.encode('utf-8'))
 
     def encrypt(self, text: str) -> str:
-        """文字列を暗号化する
+        """文字列を暗号化する（AES-GCM）
+        暗号文字列はbase64形式で返す
 
         Args:
             text (str): 文字列（平文）
@@ -162,10 +216,15 @@ class MyCipher:
             raise TypeError(f'invalid arg type {type(text)}, '
                             f'must be {str}.')
 
-        return self._cipher.encrypt(text.encode('utf-8')).hex()
+        nonce = os.urandom(_GCM_NONCE_SIZE)
+        ciphertext, tag = self._gcm_cipher(nonce).encrypt_and_digest(
+            text.encode('utf-8'))
+        return base64.b64encode(nonce + ciphertext + tag).decode('ascii')
 
     def decrypt(self, text: str) -> str:
         """暗号文字列を復号化する
+        改ざんやパスワード誤りはGCMのタグで検出する
+        旧形式（16進文字列）も復号化できる（旧形式はタグがないので検出できない）
 
         Args:
             text (str): 文字列（暗号）
@@ -182,8 +241,25 @@ class MyCipher:
                             f'must be {str}.')
 
         try:
-            return self._cipher.decrypt(binascii.a2b_hex(text)).decode('utf-8')
-        except PasswordNotSet as e:
-            raise PasswordNotSet(e)
+            if _HEX_TEXT.fullmatch(text):
+                # 16進文字列は旧形式の鍵で暗号化されている
+                return self._legacy_cipher.decrypt(
+                    bytes.fromhex(text)).decode('utf-8')
+            data = base64.b64decode(text, validate=True)
+        except binascii.Error:
+            raise DecryptionError("Don't decode the text")
         except UnicodeDecodeError:
             raise DecryptionError("Don't decrypt the text")
+
+        if len(data) < _GCM_NONCE_SIZE + _GCM_TAG_SIZE:
+            raise DecryptionError("Don't decrypt the text")
+        nonce = data[:_GCM_NONCE_SIZE]
+        ciphertext = data[_GCM_NONCE_SIZE:-_GCM_TAG_SIZE]
+        tag = data[-_GCM_TAG_SIZE:]
+        try:
+            # タグが一致しない（改ざん、パスワード誤り）とValueErrorとなる
+            return self._gcm_cipher(nonce).decrypt_and_verify(
+                ciphertext, tag).decode('utf-8')
+        except ValueError:
+            # UnicodeDecodeErrorもValueErrorのサブクラス
+            raise DecryptionError("Don't decrypt the text")
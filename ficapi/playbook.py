@@ -20,47 +20,471 @@ In this module, the parameter object is named "Playbook".
 """
 from __future__ import annotations
 
-import dataclasses
-import json
+import atexit
+import importlib.util
+import os
 import re
-from dataclasses import dataclass, field
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import repeat
 from os import PathLike
 from pathlib import Path
-from typing import Any, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence
 
-import requests
+# requests, httpxはインポートに時間がかかるので、使用する時にインポートする
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# orjsonがあれば使用する
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+# pathの置換対象（'{...}'）
+_CURLY = re.compile(r'{([^{}]+?)}')
+# header, body, parameterの置換対象（'<...>'）
+_ANGLE = re.compile(r'<([^<>]+?)>')
+# 置換の入れ子の上限（これを超えたら循環参照とみなす）
+_MAX_DEPTH = 32
+
+# replace()の結果を保持する置換テーブルの要素数の上限と、保持する結果の数
+_MEMO_TABLE_SIZE = 32
+_MEMO_SIZE = 64
+
+# 環境変数 FICAPI_VALIDATE=0 ならPlaybookParameterのチェックを省略する
+_VALIDATE = os.environ.get('FICAPI_VALIDATE', '1') != '0'
+# PlaybookParameterは__slots__を使用する（Python 3.10以降）
+_DATACLASS_OPTIONS: dict[str, Any] = (
+    {'slots': True} if sys.version_info >= (3, 10) else {}
+)
 
 
 class InvalidMethod(Exception):
     """Invalid Method"""
 
 
-@dataclass(frozen=True)
-class PlaybookParameter:
+def _read_only(self, *args, **kwargs) -> None:
+    """変更不可のコンテナの変更メソッド（常に例外を発生させる）
+
+    Raises:
+        TypeError: 変更不可
+    """
+    raise TypeError(f"'{type(self).__name__}' object is read-only.")
+
+
+class _FrozenDict(dict):
+    """変更できない辞書（header, body, parameterとその要素に使用する）
+    dictのサブクラスなので、JSONへの変換やcopy, pickleは辞書と同様に行える
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple:
+        return type(self), (dict(self),)
+
+
+class _FrozenList(list):
+    """変更できないリスト（header, body, parameterの要素に使用する）
+    listのサブクラスなので、JSONへの変換やcopy, pickleはリストと同様に行える
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = _read_only
+    clear = sort = reverse = _read_only
+
+    def __reduce__(self) -> tuple:
+        return type(self), (list(self),)
+
+
+# 変更できないので複製しない値の型
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(node: Any) -> tuple[Any, Any]:
+    """辞書とリストを要素まで再帰的に変更できないものにし、
+    同時に置換対象（'<...>'を含む文字列）の位置を調べる
+    タプルはJSONと同様にリストとして扱う（置換対象も置換される）
+    変更できないものは複製しない
+    'a < b'のように'<'を含んでも置換対象がない文字列は対象外とする
+
+    Args:
+        node (Any): header, body, parameterまたはその要素
+
+    Returns:
+        tuple[Any, Any]: 変更できないnode（辞書、リスト、タプル以外はそのまま）
+            と置換対象の位置
+            - True: node自体が置換対象の文字列
+            - dict: 置換対象を含む要素のキー（リストはインデックス）と
+                    その要素の置換対象の位置
+            - None: 置換対象なし
+    """
+    # JSONの型はtype()で判定し、それ以外の場合のみisinstance()で判定する
+    cls = type(node)
+    if cls is str:
+        return node, (True if '<' in node and _ANGLE.search(node) else None)
+    if cls in _IMMUTABLE_TYPES:
+        return node, None
+    if cls is _FrozenDict or cls is _FrozenList:
+        # 要素も変更できないので、置換対象の位置だけ調べる
+        if not node:
+            return node, None
+        frozen = node
+        items = node.items() if cls is _FrozenDict else enumerate(node)
+        setitem = None
+    elif cls is dict or (cls is not list and cls is not tuple
+                         and isinstance(node, Mapping)):
+        frozen = _FrozenDict(node)
+        items = node.items()
+        setitem = dict.__setitem__
+    elif cls is list or cls is tuple or isinstance(node, (list, tuple)):
+        frozen = _FrozenList(node)
+        items = enumerate(node)
+        setitem = list.__setitem__
+    else:
+        return node, None
+
+    # 置換対象の位置の辞書は、置換対象がある場合だけ作成する
+    # 要素が辞書やリストの場合だけ置き換える
+    markers = None
+    for key, value in items:
+        value_cls = type(value)
+        if value_cls is str:
+            if '<' in value and _ANGLE.search(value):
+                if markers is None:
+                    markers = {}
+                markers[key] = True
+            continue
+        if value_cls in _IMMUTABLE_TYPES:
+            continue
+        new_value, m = _freeze(value)
+        if m is not None:
+            if markers is None:
+                markers = {}
+            markers[key] = m
+        if new_value is not value:
+            setitem(frozen, key, new_value)
+    return frozen, markers
+
+
+# header, body, parameterを省略した場合の値（全インスタンスで共有する）
+_EMPTY: Mapping[str, Any] = _FrozenDict()
+
+
+def _empty() -> Mapping[str, Any]:
+    """header, body, parameterの既定値（_EMPTY）を返す"""
+    return _EMPTY
+
+
+def _new_session() -> requests.Session:
+    """HTTPセッションを作成する
+
+    Returns:
+        requests.Session: 接続を再利用し、リトライするセッション
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # 502/503/504はバックオフしてリトライする（Retry-Afterヘッダには既定で従う）
+    # リトライしきれなかった場合は例外にせずレスポンスを返す
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3,
+                          backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504],
+                          raise_on_status=False),
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    """非同期HTTPクライアントを作成する
+    h2がインストールされていればHTTP/2を使用する
+
+    Raises:
+        ModuleNotFoundError: httpxがインストールされていない
+
+    Returns:
+        httpx.AsyncClient: 非同期HTTPクライアント
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ModuleNotFoundError(
+            'httpx is required for async execution.') from None
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec('h2') is not None,
+        limits=httpx.Limits(max_connections=100),
+    )
+
+
+# Playbook.exec()が既定で使用するHTTPセッション（最初の実行時に作成する）
+_SESSION: requests.Session | None = None
+
+
+def _default_session() -> requests.Session:
+    """共有のHTTPセッションを返す
+    最初に呼び出された時に作成し、終了時に閉じるよう登録する
+
+    Returns:
+        requests.Session: 共有のHTTPセッション
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _new_session()
+        atexit.register(_SESSION.close)
+    return _SESSION
+
+
+@lru_cache(maxsize=256)
+def _split_template(template: str, pattern: re.Pattern) -> tuple[str, ...]:
+    """文字列を置換対象（'{...}'または'<...>'）で分割する
+    偶数番目は置換しない文字列、奇数番目は置換対象のキーとなる
+    キャッシュするのはPlaybookParameterの値（置換前のテンプレート）のみとし、
+    置換テーブルの値や置換後の文字列（トークンIDや時刻など）には使用しない
+
+    Args:
+        template (str): 文字列
+        pattern (re.Pattern): 置換対象（_CURLYまたは_ANGLE）
+
+    Returns:
+        tuple[str, ...]: 分割した文字列
+    """
+    return tuple(pattern.split(template))
+
+
+def _interp(template: str,
+            pattern: re.Pattern,
+            repl_table: Mapping[str, str],
+            depth: int = 0,
+            parts: Sequence[str] | None = None
+            ) -> str:
+    """文字列の置換対象（'{...}'または'<...>'）を再帰的に置換する
+    置換後の値に置換対象があれば、その値を先に展開してから埋め込む
+    埋め込んだ結果、新たな置換対象ができた場合（'{{...}}'など）は再度置換する
+
+    Args:
+        template (str): 文字列
+        pattern (re.Pattern): 置換対象（_CURLYまたは_ANGLE）
+        repl_table (Mapping[str, str]): 文字列置換テーブル
+        depth (int): 置換の入れ子の深さ
+        parts (Sequence[str] | None): templateを分割したもの
+            （_split_template()の結果、Noneならキャッシュせずに分割する）
+
+    Returns:
+        str: 置換後の文字列
+
+    Raises:
+        KeyError: repl_tableに置換対象のキーがない
+        ValueError: 置換の入れ子が深すぎる（循環参照）
+    """
+    if parts is None:
+        parts = pattern.split(template)
+    while len(parts) > 1:
+        depth += 1
+        if depth > _MAX_DEPTH:
+            raise ValueError(f'placeholders in "{template}" are nested too '
+                             f'deeply, circular reference in repl_table?')
+        template = ''.join(
+            _interp(repl_table[part], pattern, repl_table, depth)
+            if i % 2 else part
+            for i, part in enumerate(parts)
+        )
+        parts = pattern.split(template)
+    return template
+
+
+@lru_cache(maxsize=256)
+def _is_format_path(path: str) -> bool:
+    """pathをstr.format_map()で置換できるか判定する
+    置換対象のキーが全て識別子で、置換対象以外に'{', '}'がない場合のみ可能
+    （'{{...}}'はformat_map()ではエスケープとして扱われてしまうため不可）
+
+    Args:
+        path (str): 文字列
+
+    Returns:
+        bool: format_map()で置換できればTrue
+    """
+    parts = _split_template(path, _CURLY)
+    return (all(key.isidentifier() for key in parts[1::2])
+            and not any('{' in text or '}' in text for text in parts[::2]))
+
+
+class _PathTable:
+    """pathのformat_map()用の置換テーブル
+    値に置換対象があれば、その値を展開してから返す
+    """
+    __slots__ = ('repl_table',)
+
+    def __init__(self, repl_table: Mapping[str, str]):
+        self.repl_table = repl_table
+
+    def __getitem__(self, key: str) -> str:
+        return _interp(self.repl_table[key], _CURLY, self.repl_table, 1)
+
+
+def _interp_path(path: str, repl_table: Mapping[str, str]) -> str:
+    """pathの置換対象（'{...}'）を再帰的に置換する
+    可能ならstr.format_map()で置換し、そうでなければ_interp()で置換する
+
+    Args:
+        path (str): 文字列
+        repl_table (Mapping[str, str]): 文字列置換テーブル
+
+    Returns:
+        str: 置換後の文字列
+
+    Raises:
+        KeyError: repl_tableに置換対象のキーがない
+        ValueError: 置換の入れ子が深すぎる（循環参照）
+    """
+    if _is_format_path(path):
+        return path.format_map(_PathTable(repl_table))
+    return _interp(path, _CURLY, repl_table,
+                   parts=_split_template(path, _CURLY))
+
+
+def _memo_key(repl_table: Mapping[str, str],
+              cache: bool = False
+              ) -> tuple | None:
+    """replace()の結果を保持するためのキーを返す
+    キーは置換テーブルの型と内容なので、テーブルが変更されても誤らない
+    キーの作成にコストがかかる大きなテーブルは対象外とする
+    ただし、読み取り専用（MappingProxyType）のテーブルとcache=Trueの場合は
+    同じテーブルで繰り返し置換するものとみなし、大きさによらず対象とする
+    dictのサブクラス（defaultdictや大文字・小文字を区別しない辞書など）は
+    キーの検索方法が異なるので、cache=Trueの場合のみ対象とする
+
+    Args:
+        repl_table (Mapping[str, str]): 文字列置換テーブル
+        cache (bool): Trueなら大きさや型によらず対象とする
+
+    Returns:
+        tuple | None: キー（対象外の場合はNone）
+    """
+    if cache or isinstance(repl_table, MappingProxyType):
+        pass
+    elif type(repl_table) is not dict or len(repl_table) > _MEMO_TABLE_SIZE:
+        return None
+    try:
+        memo_key = (type(repl_table), tuple(sorted(repl_table.items())))
+        hash(memo_key)
+    except TypeError:
+        return None
+    return memo_key
+
+
+def _sub_tree(node: Any, markers: Any, repl_table: Mapping[str, str]) -> Any:
+    """置換対象の'<...>'を置換した複製を返す
+    置換対象を含まない要素は複製せずそのまま使用する（変更できないので共有してよい）
+
+    Args:
+        node (Any): header, body, parameterまたはその要素
+        markers (Any): _freeze()が返す置換対象の位置（Noneは不可）
+        repl_table (Mapping[str, str]): 文字列置換テーブル
+
+    Returns:
+        Any: 置換後のnode
+
+    Raises:
+        KeyError: repl_tableに置換対象のキーがない
+        ValueError: 置換の入れ子が深すぎる（循環参照）
+    """
+    if markers is True:
+        return _interp(node, _ANGLE, repl_table,
+                       parts=_split_template(node, _ANGLE))
+    if isinstance(node, dict):
+        return _FrozenDict(
+            (key, _sub_tree(value, markers[key], repl_table)
+             if key in markers else value)
+            for key, value in node.items()
+        )
+    return _FrozenList(
+        _sub_tree(value, markers[i], repl_table) if i in markers else value
+        for i, value in enumerate(node)
+    )
+
+
+class _ParameterCache:
+    """PlaybookParameterの内部キャッシュ用の基底クラス
+    データクラスのフィールドにしないため、スロットとして定義する
+    （fields(), asdict(), repr(), ==の対象外となる）
+    """
+    __slots__ = ('_markers', '_memo')
+
+    # header, body, parameterの置換対象の位置（アトリビュート名: 調査結果）
+    _markers: dict[str, Any]
+    # replace()の結果（置換テーブルの内容: 置換後のオブジェクト）
+    _memo: dict[tuple, PlaybookParameter]
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class PlaybookParameter(_ParameterCache):
     """Playbookのパラメータ保持用データクラス
     """
     method: str
     path: str
     name: str = ""
     overview: str = ""
-    header: dict[str, Any] = field(default_factory=dict)
-    body: dict[str, Any] = field(default_factory=dict)
-    parameter: dict[str, Any] = field(default_factory=dict)
+    header: Mapping[str, Any] = field(default_factory=_empty)
+    body: Mapping[str, Any] = field(default_factory=_empty)
+    parameter: Mapping[str, Any] = field(default_factory=_empty)
 
     def __post_init__(self):
+        """アトリビュートのチェック（_VALIDATEがTrueの場合のみ）
+        header, body, parameterは要素まで変更できないものにする
+        header, body, parameterの置換対象の位置もここで調べておく
+
+        Raises:
+            TypeError: アトリビュートの型が不正
+            InvalidMethod: 無効なmethod
+        """
+        if _VALIDATE:
+            self._validate()
+
+        markers = {}
+        for name in ('header', 'body', 'parameter'):
+            value, m = _freeze(getattr(self, name))
+            object.__setattr__(self, name, value)
+            if m is not None:
+                markers[name] = m
+        object.__setattr__(self, '_markers', markers)
+        object.__setattr__(self, '_memo', {})
+
+    def __reduce__(self) -> tuple:
+        """copy, pickle用（内部キャッシュは含めず、__init__()で作り直す）"""
+        return type(self), tuple(getattr(self, name)
+                                 for name in _PARAMETER_FIELDS)
+
+    def _validate(self) -> None:
         """アトリビュートの型チェックとmethodの値チェック
 
         Raises:
             TypeError: アトリビュートの型が不正
             InvalidMethod: 無効なmethod
         """
+        # dictを先に判定する（Mappingだけの判定は遅いため）
         if not all((isinstance(self.method, str),
                     isinstance(self.path, str),
                     isinstance(self.name, str),
                     isinstance(self.overview, str),
-                    isinstance(self.header, dict),
-                    isinstance(self.body, dict),
-                    isinstance(self.parameter, dict),
+                    isinstance(self.header, (dict, Mapping)),
+                    isinstance(self.body, (dict, Mapping)),
+                    isinstance(self.parameter, (dict, Mapping)),
                     )):
             raise TypeError(f'{type(self).__name__}: '
                             f'attribute type is invalid.')
@@ -71,7 +495,10 @@ class PlaybookParameter:
                 f'implemented, only "get" and "post".'
             )
 
-    def replace(self, repl_table: Mapping[str, str]) -> PlaybookParameter:
+    def replace(self,
+                repl_table: Mapping[str, str],
+                cache: bool = False
+                ) -> PlaybookParameter:
         """各パラメータの変数部分を置換し新しいPlaybookParameterを返す
         置換対象は以下の通り
         - pathの '{...}'
@@ -92,46 +519,92 @@ class PlaybookParameter:
         Args:
             repl_table (Mapping[str, str]):
                 置換前文字列をキー、置換後文字列を値とする辞書
+            cache (bool): Trueなら置換テーブルの大きさや型によらず結果を保持する
+                （MappingProxyTypeの置換テーブルは常に保持する）
 
         Returns:
             PlaybookParameter: 置換後のオブジェクト
 
         Raised:
             KeyError: repl_tableの置換前文字列をキーとす要素がない
+            ValueError: 置換の入れ子が深すぎる（循環参照）
         """
-        def _replace(m: re.Match) -> str:
-            return repl_table[m.group(1)]
-
         if not isinstance(repl_table, Mapping):
             raise TypeError(f'invalid arg type {type(repl_table)}, '
                             f'must be {Mapping}.')
 
+        # 置換対象がなければ自身を返す（frozenなので共有してよい）
+        if not self._markers and '{' not in self.path:
+            return self
+
+        # 同じ内容の置換テーブルで置換済みなら、その結果を返す
+        memo_key = _memo_key(repl_table, cache)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        # 置換対象がある header, body, parameter だけ置換する
+        # KeyErrorにはキーが見つからなかったアトリビュート名を含める
+        name = 'path'
         try:
-            path = self.path
-            while '{' in path:
-                path = re.sub(r'{([^{}]+?)}', _replace, path)
+            path = _interp_path(self.path, repl_table)
+            values = {}
+            for name, m in self._markers.items():
+                values[name] = _sub_tree(getattr(self, name), m, repl_table)
 
-            header = json.dumps(self.header)
-            while '<' in header:
-                header = re.sub(r'<([^<>]+?)>', _replace, header)
+        except KeyError as e:
+            raise KeyError(f'repl_table does not have "{e.args[0]}" '
+                           f'(in {name}).') from None
 
-            body = json.dumps(self.body)
-            while '<' in body:
-                body = re.sub(r'<([^<>]+?)>', _replace, body)
+        new_param = self._fast_replace(path=path, **values)
+        if memo_key is not None:
+            if len(self._memo) >= _MEMO_SIZE:
+                self._memo.clear()
+            self._memo[memo_key] = new_param
+        return new_param
 
-            parameter = json.dumps(self.parameter)
-            while '<' in parameter:
-                parameter = re.sub(r'<([^<>]+?)>', _replace, parameter)
+    def _fast_replace(self, **changes: Any) -> PlaybookParameter:
+        """アトリビュートを変更した複製を返す（replace()の置換結果用）
+        __init__()と__post_init__()を経由しないのでチェックは行わない
+        置換後の値は置換対象を含まないので、置換対象の位置は空とする
 
-        except KeyError as e:
-            raise KeyError(f'repl_table does not have "{str(e)}".')
+        Args:
+            **changes (Any): 変更するアトリビュート
 
-        return dataclasses.replace(self,
-                                   path=path,
-                                   header=json.loads(header),
-                                   body=json.loads(body),
-                                   parameter=json.loads(parameter),
-                                   )
+        Returns:
+            PlaybookParameter: 変更後のオブジェクト
+        """
+        new_param = object.__new__(type(self))
+        for name in _PARAMETER_FIELDS:
+            object.__setattr__(new_param, name,
+                               changes.get(name, getattr(self, name)))
+        object.__setattr__(new_param, '_markers', {})
+        object.__setattr__(new_param, '_memo', {})
+        return new_param
+
+
+# PlaybookParameterのアトリビュート名（フィールドの順）
+_PARAMETER_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(PlaybookParameter)
+)
+
+
+@lru_cache(maxsize=128)
+def _load_playbook_file(file: str, mtime_ns: int) -> PlaybookParameter:
+    """JSONファイルを読み込みPlaybookParameterを返す
+    ファイル名と更新時刻が同じなら読み込み済みのものを返す
+    （PlaybookParameterはheader, body, parameterの要素まで変更できないので
+    共有してよい）
+
+    Args:
+        file (str): JSONファイル名（絶対パス）
+        mtime_ns (int): ファイルの更新時刻（キャッシュのキーとして使用する）
+
+    Returns:
+        PlaybookParameter: パラメータオブジェクト
+    """
+    return PlaybookParameter(
+        **_loads(Path(file).read_bytes())
+    )
 
 
 class Playbook:
@@ -151,15 +624,17 @@ class Playbook:
         """
         self.playbook: PlaybookParameter
         self.new_playbook: PlaybookParameter | None = None
+        # exec()で使用するHTTPセッション（Noneなら共有のセッション）
+        self.session: requests.Session | None = None
 
         if isinstance(playbook, PlaybookParameter):
             self.playbook = playbook
         elif isinstance(playbook, dict):
             self.playbook = PlaybookParameter(**playbook)
         elif isinstance(playbook, (PathLike, str)):
-            self.playbook = PlaybookParameter(
-                **json.loads(Path(playbook).read_text(encoding='utf-8'))
-            )
+            file = os.path.abspath(playbook)
+            self.playbook = _load_playbook_file(file,
+                                                os.stat(file).st_mtime_ns)
         else:
             raise TypeError(f'invalid arg type {type(playbook)}.')
 
@@ -178,12 +653,16 @@ class Playbook:
                             f'must be {Mapping}.')
         self.playbook = self.playbook.replace(repl_table)
 
-    def exec(self, repl_table: Mapping[str, str] | None = None
+    def exec(self,
+             repl_table: Mapping[str, str] | None = None,
+             session: requests.Session | None = None
              ) -> requests.Response:
         """Playbookを実効する
 
         Args:
             repl_table (Mapping[str, str] | None): 文字列置換テーブル
+            session (requests.Session | None): HTTPセッション
+                Noneの場合はself.session、それもNoneなら共有のセッション
 
         Raises:
             TypeError: repl_tableの型が不正
@@ -200,14 +679,125 @@ class Playbook:
             raise TypeError(f'invalid arg type {type(repl_table)}, '
                             f'must be {Mapping}.')
 
-        if self.new_playbook.method == 'get':
-            return requests.get(self.new_playbook.path,
-                                headers=self.new_playbook.header,
-                                params=self.new_playbook.parameter)
-        elif self.new_playbook.method == 'post':
-            return requests.post(self.new_playbook.path,
-                                 headers=self.new_playbook.header,
-                                 json=self.new_playbook.body)
+        http = session or self.session or _default_session()
+        return _send(self.new_playbook, http)
+
+    def exec_many(self,
+                  repl_tables: Iterable[Mapping[str, str]],
+                  max_workers: int = 8,
+                  session: requests.Session | None = None
+                  ) -> list[requests.Response]:
+        """文字列置換テーブル毎にPlaybookを並行して実行する
+        同じセッションの接続を使い回すので、max_workersは
+        セッションのコネクションプール（共有のセッションは20）以下にすること
+
+        Args:
+            repl_tables (Iterable[Mapping[str, str]]): 文字列置換テーブルの並び
+            max_workers (int): 並行して実行する数
+            session (requests.Session | None): HTTPセッション
+                Noneの場合はself.session、それもNoneなら共有のセッション
+
+        Raises:
+            TypeError: repl_tablesの要素の型が不正
+            ValueError: method が "get" または "post" ではない
+
+        Returns:
+            list[requests.Response]: レスポンスオブジェクト（repl_tablesの順）
+        """
+        new_playbooks = []
+        for repl_table in repl_tables:
+            if not isinstance(repl_table, Mapping):
+                raise TypeError(f'invalid arg type {type(repl_table)}, '
+                                f'must be {Mapping}.')
+            new_playbooks.append(self.playbook.replace(repl_table))
+
+        http = session or self.session or _default_session()
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(_send, new_playbooks, repeat(http)))
+
+    async def aexec(self,
+                    repl_table: Mapping[str, str] | None = None,
+                    client: httpx.AsyncClient | None = None
+                    ) -> httpx.Response:
+        """Playbookを非同期に実効する（httpxが必要）
+        多数のPlaybookを並行して実行する場合は、clientを共有すること
+
+        Args:
+            repl_table (Mapping[str, str] | None): 文字列置換テーブル
+            client (httpx.AsyncClient | None): 非同期HTTPクライアント
+                Noneの場合はこの実行のためだけに作成する
+
+        Raises:
+            TypeError: repl_tableの型が不正
+            ValueError: method が "get" または "post" ではない
+            ModuleNotFoundError: httpxがインストールされていない
+
+        Returns:
+            httpx.Response: レスポンスオブジェクト
+        """
+        if isinstance(repl_table, Mapping):
+            self.new_playbook = self.playbook.replace(repl_table)
+        elif repl_table is None:
+            self.new_playbook = self.playbook.replace({})
         else:
-            raise ValueError(f'invalid method "{self.new_playbook.method}", '
-                             f'must be "get" or "post".')
+            raise TypeError(f'invalid arg type {type(repl_table)}, '
+                            f'must be {Mapping}.')
+
+        if client is not None:
+            return await _asend(self.new_playbook, client)
+        async with _new_async_client() as client:
+            return await _asend(self.new_playbook, client)
+
+
+def _send(playbook: PlaybookParameter, http: Any) -> requests.Response:
+    """置換済みのPlaybookParameterでリクエストを送信する
+
+    Args:
+        playbook (PlaybookParameter): 置換済みのパラメータオブジェクト
+        http (Any): HTTPセッション（get()とpost()を持つもの）
+
+    Raises:
+        ValueError: method が "get" または "post" ではない
+
+    Returns:
+        requests.Response: レスポンスオブジェクト
+    """
+    if playbook.method == 'get':
+        return http.get(playbook.path,
+                        headers=playbook.header,
+                        params=playbook.parameter)
+    elif playbook.method == 'post':
+        return http.post(playbook.path,
+                         headers=playbook.header,
+                         json=playbook.body)
+    else:
+        raise ValueError(f'invalid method "{playbook.method}", '
+                         f'must be "get" or "post".')
+
+
+async def _asend(playbook: PlaybookParameter,
+                 client: httpx.AsyncClient
+                 ) -> httpx.Response:
+    """置換済みのPlaybookParameterで非同期にリクエストを送信する
+
+    Args:
+        playbook (PlaybookParameter): 置換済みのパラメータオブジェクト
+        client (httpx.AsyncClient): 非同期HTTPクライアント
+
+    Raises:
+        ValueError: method が "get" または "post" ではない
+
+    Returns:
+        httpx.Response: レスポンスオブジェクト
+    """
+    if playbook.method == 'get':
+        return await client.get(playbook.path,
+                                headers=playbook.header,
+                                params=playbook.parameter)
+    elif playbook.method == 'post':
+        return await client.post(playbook.path,
+                                 headers=playbook.header,
+                                 json=playbook.body)
+    else:
+        raise ValueError(f'invalid method "{playbook.method}", '
+                         f'must be "get" or "post".')
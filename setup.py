@@ -20,5 +20,9 @@ setup(
       create_ficapi_ini = ficapi.create_ini:main
     """,
     install_requires=(here / 'requirements.txt').read_text().splitlines(),
+    extras_require={
+        'orjson': ['orjson'],
+        'httpx': ['httpx'],
+    },
     python_requires='>=3.7',
 )
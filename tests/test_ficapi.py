@@ -0,0 +1,215 @@
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+import requests
+from ficapi.ficapi import FicAPI, _Tenant
+from ficapi.fictoken import FicToken
+from ficapi.mycipher import MyCipher
+
+PASSWORD = 'test'
+TENANT_ID = 'tid'
+TOKEN_ID = 'abcdefghijklmn'
+EXPIRES = '2101-01-01T00:00:00.000000Z'
+
+
+class Session:
+    def __init__(self, body=None):
+        self.calls = []
+        self.body = body or {}
+
+    def get(self, url, headers, params):
+        self.calls.append(('get', url, params))
+        return response(self.body)
+
+    def post(self, url, headers, json):
+        self.calls.append(('post', url, json))
+        return response({'token': {'expires_at': EXPIRES}},
+                        {'X-Subject-Token': TOKEN_ID})
+
+    def close(self):
+        pass
+
+
+def response(body, headers=None):
+    r = requests.Response()
+    r.status_code = 200
+    r._content = json.dumps(body).encode('utf-8')
+    r.headers.update(headers or {})
+    return r
+
+
+def write_ini(file, auth=True, tenant=True, **options):
+    cipher = MyCipher(PASSWORD)
+    lines = ['[DEFAULT]', 'api_endpoint = https://api.example']
+    if auth:
+        lines += ['[auth]',
+                  f'api_key = {cipher.encrypt("key")}',
+                  f'api_secret = {cipher.encrypt("secret")}']
+    else:
+        lines += ['[auth]']
+    if tenant:
+        lines += ['[tenant]', f'tenant_id = {TENANT_ID}']
+        lines += [f'{key} = {value}' for key, value in options.items()]
+    file.write_text('\n'.join(lines), encoding='utf-8')
+
+
+@pytest.fixture
+def fic(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_ini(tmp_path / 'ficapi.ini',
+              **{'tenantId': '{tenant_id}', 'from': '-2hours',
+                 'to': '2021-01-01 00:00:00+00:00'})
+    fic = FicAPI('ficapi.ini', password=PASSWORD)
+    fic._session = Session()
+    return fic
+
+
+def count_calls(monkeypatch, cls, name):
+    calls = []
+    method = getattr(cls, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return method(*args, **kwargs)
+    monkeypatch.setattr(cls, name, wrapper)
+    return calls
+
+
+def write_token(file, token_id, mtime_ns):
+    FicToken({'X-Subject-Token': token_id, 'expires_at': EXPIRES},
+             password=PASSWORD).write(file)
+    os.utime(file, ns=(mtime_ns, mtime_ns))
+
+
+def test_tenant_01():
+    """tenant 1: case-insensitive access"""
+    tenant = _Tenant({'From': 'x', 'tenant_ID': 't'})
+    assert tenant['FROM'] == 'x'
+    assert 'Tenant_Id' in tenant
+    assert tenant.get('from') == 'x'
+    assert tenant.get('to', 'now') == 'now'
+    tenant['Port-A'] = 'p1'
+    assert list(tenant) == ['from', 'tenant_id', 'port-a']
+    del tenant['PORT-A']
+    assert 'port-a' not in tenant
+
+
+def test_tenant_02():
+    """tenant 2: pop, setdefault, update"""
+    tenant = _Tenant({'From': 'x'})
+    assert tenant.pop('FROM') == 'x'
+    assert tenant.pop('from', None) is None
+    assert tenant.setdefault('Foo', 'a') == 'a'
+    assert tenant.setdefault('FOO', 'b') == 'a'
+    tenant.update({'Bar': 'b'}, Baz='c')
+    tenant |= {'Qux': 'd'}
+    assert dict(tenant) == {'foo': 'a', 'bar': 'b', 'baz': 'c', 'qux': 'd'}
+
+
+def test_tenant_03():
+    """tenant 3: copy, fromkeys, |"""
+    tenant = _Tenant({'From': 'x'})
+    for new in (tenant.copy(), tenant | {'To': 'y'},
+                _Tenant.fromkeys(['From', 'TO'], 'z')):
+        assert isinstance(new, _Tenant)
+        assert new['FROM'] in ('x', 'z')
+    assert 'to' not in tenant
+    assert dict(_Tenant.fromkeys(['A', 'b'])) == {'a': None, 'b': None}
+
+
+def test_token_01(fic, monkeypatch):
+    """token 1: write token file only when refreshed"""
+    writes = count_calls(monkeypatch, FicToken, 'write')
+    fic.get_token()
+    fic.get_token()
+    assert [call[0] for call in fic._session.calls] == ['post']
+    assert len(writes) == 1
+    assert fic.tenant['token_id'] == TOKEN_ID
+    assert FicToken(fic.token_file, password=PASSWORD).id == TOKEN_ID
+
+
+def test_token_02(fic, monkeypatch):
+    """token 2: read token file only when changed"""
+    reads = count_calls(monkeypatch, FicToken, 'read')
+    writes = count_calls(monkeypatch, FicToken, 'write')
+    write_token(fic.token_file, 'token1', 1_000_000_000)
+    fic.get_token()
+    assert len(reads) == 1
+    assert fic.tenant['token_id'] == 'token1'
+
+    # expired, file unchanged: refresh without reading
+    fic._token._expire_time = datetime(2001, 1, 1, tzinfo=timezone.utc)
+    fic.get_token()
+    assert len(reads) == 1
+    assert len(writes) == 2
+    assert fic.tenant['token_id'] == TOKEN_ID
+
+    # expired, file changed: read it
+    fic._token._expire_time = datetime(2001, 1, 1, tzinfo=timezone.utc)
+    write_token(fic.token_file, 'token2', 2_000_000_000)
+    fic.get_token()
+    assert len(reads) == 2
+    assert fic.tenant['token_id'] == 'token2'
+    assert [call[0] for call in fic._session.calls] == ['post']
+
+
+def test_request_01(fic):
+    """request 1: relative from (-2hours)"""
+    fic.request({'method': 'get', 'path': '{api_endpoint}/x',
+                 'parameter': {'from': '<from>', 'to': '<to>'}})
+    assert fic._session.calls[-1] == ('get', 'https://api.example/x', {
+        'from': '2020-12-31 22:00:00+00:00',
+        'to': '2021-01-01 00:00:00+00:00',
+    })
+    assert fic.tenant['from'] == '-2hours'
+
+
+def test_ini_01(tmp_path):
+    """ini 1: all missing options in section are listed"""
+    write_ini(tmp_path / 'ficapi.ini', auth=False)
+    with pytest.raises(ValueError, match='"api_key, api_secret"'):
+        FicAPI(tmp_path / 'ficapi.ini', password=PASSWORD)
+
+
+def test_ini_02(tmp_path):
+    """ini 2: missing section"""
+    write_ini(tmp_path / 'ficapi.ini', tenant=False)
+    with pytest.raises(ValueError, match='"tenant_id"'):
+        FicAPI(tmp_path / 'ficapi.ini', password=PASSWORD)
+
+
+def test_ini_03(tmp_path):
+    """ini 3: file not found"""
+    with pytest.raises(FileNotFoundError):
+        FicAPI(tmp_path / 'ficapi.ini', password=PASSWORD)
+
+
+def test_resources_01(fic):
+    """resources 1: resource names and ids"""
+    fic._session = Session({
+        'tenantName': 'Tenant',
+        'ports': [{'name': 'Port-A', 'portId': 'F010123456789'}],
+        'connections': [{'name': 'Conn-A', 'connectionId': 'F030123456789'}],
+        'routers': [{'name': 'Router-A', 'routerId': 'F020123456789',
+                     'fwId': 'F040123456789', 'natId': ''}],
+    })
+    fic.get_resources()
+    assert fic._session.calls[-1][1] == (
+        'https://api.example/fic-monitoring/v1/flexible-ic/tenants/tid')
+    expected = {
+        'tenantName': 'Tenant',
+        'Port-A': 'F010123456789',
+        'F010123456789': 'Port-A',
+        'Conn-A': 'F030123456789',
+        'F030123456789': 'Conn-A',
+        'Router-A': 'F020123456789',
+        'F020123456789': 'Router-A',
+        'Router-A_fwId': 'F040123456789',
+        'F040123456789': 'Router-A_fwId',
+    }
+    for key, value in expected.items():
+        assert fic.tenant[key] == value
+    assert 'Router-A_natId' not in fic.tenant
+    assert '' not in fic.tenant
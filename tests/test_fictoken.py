@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 from ficapi.fictoken import FicToken
-from ficapi.mycipher import DecryptionError, PasswordNotSet
+from ficapi.mycipher import DecryptionError, MyCipher, PasswordNotSet
 
 PASSWORD = 'test'
 INVALID_PASSWORD = 'hoge'
@@ -49,3 +49,9 @@ def test_write_01():
     assert token.id == token2.id
     # 削除しとく
     (path / 'hoge.json').unlink()
+
+
+def test_read_06():
+    """read with cipher"""
+    token = FicToken(path / 'token_valid.json', cipher=MyCipher(PASSWORD))
+    assert token.id == TOKEN_ID
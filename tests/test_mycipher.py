@@ -0,0 +1,55 @@
+import base64
+
+import pytest
+from ficapi.mycipher import DecryptionError, MyCipher, PasswordNotSet
+
+PASSWORD = 'test'
+INVALID_PASSWORD = 'hoge'
+TEXT = 'abcdefghijklmn'
+HEX_TEXT = 'd8e581220b570a386dccdfb6b281'
+
+
+def test_encrypt_01():
+    """encrypt and decrypt"""
+    cipher = MyCipher(PASSWORD)
+    assert cipher.decrypt(cipher.encrypt(TEXT)) == TEXT
+
+
+def test_encrypt_02():
+    """password not set"""
+    with pytest.raises(PasswordNotSet):
+        MyCipher().encrypt(TEXT)
+
+
+def test_decrypt_01():
+    """decrypt legacy hex text"""
+    assert MyCipher(PASSWORD).decrypt(HEX_TEXT) == TEXT
+
+
+def test_decrypt_02():
+    """password error"""
+    with pytest.raises(DecryptionError):
+        MyCipher(INVALID_PASSWORD).decrypt(HEX_TEXT)
+
+
+def test_decrypt_03():
+    """invalid text"""
+    with pytest.raises(DecryptionError):
+        MyCipher(PASSWORD).decrypt('#')
+
+
+def test_decrypt_05():
+    """password error (AES-GCM)"""
+    text = MyCipher(PASSWORD).encrypt(TEXT)
+    with pytest.raises(DecryptionError):
+        MyCipher(INVALID_PASSWORD).decrypt(text)
+
+
+def test_decrypt_06():
+    """short or tampered base64 text (AES-GCM)"""
+    cipher = MyCipher(PASSWORD)
+    data = bytearray(base64.b64decode(cipher.encrypt(TEXT)))
+    data[-1] ^= 1
+    for text in ('AAAAAA==', base64.b64encode(data).decode('ascii')):
+        with pytest.raises(DecryptionError):
+            cipher.decrypt(text)
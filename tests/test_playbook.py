@@ -1,5 +1,14 @@
+import asyncio
+import copy
+import dataclasses
+import json
+import pickle
+from pathlib import Path
+from types import MappingProxyType
+
 import pytest
-from ficapi.playbook import InvalidMethod, Playbook, PlaybookParameter
+from ficapi.playbook import (InvalidMethod, Playbook, PlaybookParameter,
+                             _split_template)
 
 PATH = '{url}/codes_of_conduct'
 HEADER = {"Accept": "application/vnd.github.v3+json"}
@@ -59,3 +68,228 @@ def test_method_04():
     """method 4: hoge"""
     with pytest.raises(InvalidMethod):
         PlaybookParameter(path=PATH, header=HEADER, method='hoge')
+
+
+def test_exec_03():
+    """exec 3: use session"""
+    class Session:
+        def get(self, url, headers, params):
+            self.url = url
+            return 'response'
+
+    session = Session()
+    param = PlaybookParameter(path=PATH, header=HEADER, method='get')
+    assert Playbook(param).exec(repl, session=session) == 'response'
+    assert session.url == 'https://api.github.com/codes_of_conduct'
+
+
+def test_replace_03():
+    """replace 3: nested body"""
+    param = PlaybookParameter(path=PATH, method='post',
+                              body={'a': ['<fqdn>', {'b': 'x<fqdn>'}], 'c': 1})
+    new_param = param.replace(repl)
+    assert new_param.body == {
+        'a': ['api.github.com', {'b': 'xapi.github.com'}], 'c': 1
+    }
+    assert param.body == {'a': ['<fqdn>', {'b': 'x<fqdn>'}], 'c': 1}
+
+
+def test_exec_04():
+    """exec 4: use Playbook.session"""
+    class Session:
+        def post(self, url, headers, json):
+            self.json = json
+            return 'response'
+
+    playbook = Playbook(PlaybookParameter(path=PATH, method='post',
+                                          body={'a': '<fqdn>'}))
+    playbook.session = Session()
+    assert playbook.exec(repl) == 'response'
+    assert playbook.session.json == {'a': 'api.github.com'}
+
+
+def test_replace_04():
+    """replace 4: no placeholder"""
+    param = PlaybookParameter(path='https://api.github.com', header=HEADER,
+                              method='get')
+    assert param.replace({}) is param
+
+
+def test_replace_05():
+    """replace 5: KeyError in body"""
+    param = PlaybookParameter(path=PATH, method='post', body={'a': '<hoge>'})
+    with pytest.raises(KeyError, match='"hoge" .in body.'):
+        param.replace(repl)
+
+
+def test_file_01():
+    """file 1: reuse loaded file"""
+    file = Path('tests/playbook.json')
+    file.write_text(json.dumps({'path': PATH, 'method': 'get'}))
+    try:
+        assert Playbook(file).playbook is Playbook(str(file)).playbook
+    finally:
+        file.unlink()
+
+
+def test_file_02():
+    """file 2: loaded file can not be changed through another Playbook"""
+    file = Path('tests/playbook.json')
+    file.write_text(json.dumps({'path': PATH, 'method': 'post',
+                                'body': {'a': {'b': ['c']}}}))
+    try:
+        playbook = Playbook(file)
+        with pytest.raises(TypeError):
+            playbook.playbook.body['a']['b'].append('d')
+        with pytest.raises(TypeError):
+            playbook.playbook.body['a']['x'] = 'y'
+        assert Playbook(file).playbook.body == {'a': {'b': ['c']}}
+    finally:
+        file.unlink()
+
+
+def test_replace_06():
+    """replace 6: circular reference"""
+    param = PlaybookParameter(path='{a}', method='get')
+    with pytest.raises(ValueError):
+        param.replace({'a': '{b}', 'b': '{a}'})
+
+
+def test_exec_many_01():
+    """exec_many 1: responses in order"""
+    class Session:
+        def get(self, url, headers, params):
+            return url
+
+    param = PlaybookParameter(path='https://{fqdn}', method='get')
+    tables = [{'fqdn': f'host{i}'} for i in range(10)]
+    assert Playbook(param).exec_many(tables, session=Session()) == [
+        f'https://host{i}' for i in range(10)
+    ]
+
+
+def test_aexec_01():
+    """aexec 1: use client"""
+    httpx = pytest.importorskip('httpx')
+
+    async def aexec():
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, text=str(request.url)))
+        async with httpx.AsyncClient(transport=transport) as client:
+            param = PlaybookParameter(path=PATH, method='get')
+            return await Playbook(param).aexec(repl, client=client)
+
+    r = asyncio.run(aexec())
+    assert r.text == 'https://api.github.com/codes_of_conduct'
+
+
+def test_replace_07():
+    """replace 7: reuse result for the same table contents"""
+    param = PlaybookParameter(path=PATH, header=HEADER, method='get')
+    new_param = param.replace(repl)
+    assert param.replace(dict(repl)) is new_param
+    assert param.replace({**repl, 'fqdn': 'example.com'}) is not new_param
+
+
+def test_replace_11():
+    """replace 11: memoized result can not be changed"""
+    param = PlaybookParameter(path=PATH, method='post',
+                              body={'x': {'y': '<fqdn>'}})
+    new_param = param.replace(repl)
+    with pytest.raises(TypeError):
+        new_param.body['x']['y'] = 'EVIL'
+    assert param.replace(repl).body == {'x': {'y': 'api.github.com'}}
+    assert [f.name for f in dataclasses.fields(param)] == [
+        'method', 'path', 'name', 'overview', 'header', 'body', 'parameter'
+    ]
+
+
+def test_replace_08():
+    """replace 8: path with nested and non-identifier placeholders"""
+    table = {'router': 'r1', 'r1': 'id-1', 'Port-A': 'p1', **repl}
+    param = PlaybookParameter(path='{url}/{{router}}/{Port-A}', method='get')
+    assert param.replace(table).path == 'https://api.github.com/id-1/p1'
+    with pytest.raises(KeyError, match='"url" .in path.'):
+        param.replace({})
+
+
+def test_replace_09():
+    """replace 9: reuse result for frozen or large tables"""
+    param = PlaybookParameter(path=PATH, header=HEADER, method='get')
+    large = {**repl, **{f'key{i}': str(i) for i in range(100)}}
+    new_param = param.replace(MappingProxyType(large))
+    assert param.replace(MappingProxyType(dict(large))) is new_param
+    assert param.replace(large) is not param.replace(large)
+    assert param.replace(large, cache=True) is param.replace(dict(large),
+                                                             cache=True)
+
+
+def test_replace_10():
+    """replace 10: '<' without placeholder"""
+    param = PlaybookParameter(path='https://api.github.com', method='post',
+                              body={'a': 'x < y', 'b': ['<>']})
+    assert param.replace({}) is param
+
+
+def test_readonly_01():
+    """readonly 1: header, body and parameter are read-only"""
+    param = PlaybookParameter(path=PATH, header=HEADER, method='get')
+    assert param.header == HEADER
+    with pytest.raises(TypeError):
+        param.header['Accept'] = 'text/plain'
+    assert param.body is PlaybookParameter(path=PATH, method='post').body
+    param = PlaybookParameter(path=PATH, method='post',
+                              body={'a': {'b': ['<fqdn>']}})
+    with pytest.raises(TypeError):
+        param.body['a']['c'] = 'x'
+    with pytest.raises(TypeError):
+        param.replace(repl).body['a']['b'].append('x')
+
+
+def test_copy_01():
+    """copy 1: deepcopy, pickle and asdict"""
+    param = PlaybookParameter(path=PATH, header=HEADER, method='post',
+                              body={'a': ['<fqdn>', {'b': 1}]})
+    for new_param in (copy.deepcopy(param), pickle.loads(pickle.dumps(param))):
+        assert new_param == param
+        assert new_param.replace(repl) == param.replace(repl)
+    assert dataclasses.asdict(param)['body'] == {'a': ['<fqdn>', {'b': 1}]}
+    assert json.loads(json.dumps(param.replace(repl).body)) == {
+        'a': ['api.github.com', {'b': 1}]
+    }
+
+
+def test_replace_12():
+    """replace 12: only templates are cached, not replaced values"""
+    param = PlaybookParameter(path='{url}/{{router}}', method='get',
+                              header={'X-Auth-Token': '<token_id>'})
+    _split_template.cache_clear()
+    for i in range(10):
+        param.replace({'url': f'https://{i}', 'router': f'r{i}',
+                       f'r{i}': f'id{i}', 'token_id': f'token{i}'})
+    assert _split_template.cache_info().currsize == 2
+
+
+def test_replace_13():
+    """replace 13: placeholder in tuple"""
+    param = PlaybookParameter(path=PATH, method='post',
+                              body={'a': ('<fqdn>', {'b': ('<fqdn>',)})})
+    assert param.replace(repl).body == {
+        'a': ['api.github.com', {'b': ['api.github.com']}]
+    }
+
+
+def test_replace_14():
+    """replace 14: dict subclasses do not share memoized results"""
+    class LowerDict(dict):
+        def __getitem__(self, key):
+            return super().__getitem__(key.lower())
+
+    param = PlaybookParameter(path='{TenantId}/x', method='get')
+    assert param.replace(LowerDict({'tenantid': 'T'})).path == 'T/x'
+    with pytest.raises(KeyError):
+        param.replace({'tenantid': 'T'})
+    assert param.replace(LowerDict({'tenantid': 'T'}), cache=True).path == \
+        'T/x'
+    with pytest.raises(KeyError):
+        param.replace({'tenantid': 'T'}, cache=True)